@@ -10,9 +10,14 @@ import shutil
 from pathlib import Path
 
 
+# Built once at import time; these run for every folder in the library
+_PRODUCT_ID_RE = re.compile(r'\[([A-Z0-9]+)\]')
+_BADCHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def extract_product_id(folder_name):
     """Extract the Audible product ID from folder name like 'Title [B0CYDWFPMV]'"""
-    match = re.search(r'\[([A-Z0-9]+)\]', folder_name)
+    match = _PRODUCT_ID_RE.search(folder_name)
     return match.group(1) if match else None
 
 
@@ -29,19 +34,19 @@ def load_books_data(json_path):
         return None
 
 
-def find_book_by_id(books_data, product_id):
-    """Find book entry in books.json by product ID"""
+def build_book_index(books_data):
+    """Index books.json entries by product ID for constant-time lookups"""
     # Handle both list and dict formats
-    if isinstance(books_data, list):
-        for book in books_data:
-            if book.get('AudibleProductId') == product_id:
-                return book
-    elif isinstance(books_data, dict):
+    if isinstance(books_data, dict):
         # If it's a dict with books as values
-        for book in books_data.values():
-            if book.get('AudibleProductId') == product_id:
-                return book
-    return None
+        books_data = books_data.values()
+    index = {}
+    for book in books_data:
+        product_id = book.get('AudibleProductId')
+        if product_id:
+            # Keep the first entry for a repeated ID, as a linear search would
+            index.setdefault(product_id, book)
+    return index
 
 
 def get_author_folder_name(author_names):
@@ -59,7 +64,7 @@ def get_author_folder_name(author_names):
 def sanitize_folder_name(name):
     """Remove or replace characters that are problematic in folder names"""
     # Replace problematic characters with underscore
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
+    sanitized = name.translate(_BADCHARS)
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip('. ')
     return sanitized
@@ -79,6 +84,9 @@ def main():
     
     print(f"Successfully loaded books.json")
     
+    # Index books once instead of scanning the list for every folder
+    book_index = build_book_index(books_data)
+    
     # Get all subdirectories in the current folder
     folders = [f for f in script_dir.iterdir() if f.is_dir()]
     print(f"Found {len(folders)} folders to process\n")
@@ -98,7 +106,7 @@ def main():
             continue
         
         # Find book in JSON
-        book = find_book_by_id(books_data, product_id)
+        book = book_index.get(product_id)
         
         if not book:
             print(f"⚠ Skipping '{folder_name}' - product ID {product_id} not found in books.json")
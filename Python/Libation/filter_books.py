@@ -1,40 +1,64 @@
 import json
+import os
+
+# ijson streams books one at a time instead of loading the whole export
+try:
+    import ijson
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    JSON_ERRORS = (json.JSONDecodeError,)
 
 # Read the JSON file
 input_file = 'books.json'  # Change this to your input file name
 output_file = 'not_liberated_books.txt'
+# Results go to a temp file first so a bad export can't wipe the previous list
+tmp_file = output_file + '.tmp'
 
-try:
-    with open(input_file, 'r', encoding='utf-8') as f:
+
+def iter_books(f):
+    """Yield each book in the export, handling both a list and a single object"""
+    if ijson is None:
         data = json.load(f)
-    
-    # Filter entries where BookStatus is "Not Liberated"
-    not_liberated = []
-    
-    # Handle both list of objects and single object
-    if isinstance(data, list):
-        books = data
+        yield from data if isinstance(data, list) else [data]
+        return
+
+    # Peek at the first non-whitespace byte to see if the export is a list
+    first = f.read(1)
+    while first.isspace():
+        first = f.read(1)
+    f.seek(0)
+
+    if first == b'[':
+        yield from ijson.items(f, 'item')
     else:
-        books = [data]
-    
-    for book in books:
-        if book.get('BookStatus') == 'NotLiberated' and book.get('ContentType') != 'Episode':
-            print(f"{book.get('AuthorNames')} {book.get('Title')}")
-            author = book.get('AuthorNames', 'Unknown Author')
-            title = book.get('Title', 'Unknown Title')
-            not_liberated.append(f"{author} - {title}")
-    
-    # Write to output file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for entry in not_liberated:
-            f.write(entry + '\n')
-    
-    print(f"Found {len(not_liberated)} books with 'Not Liberated' status")
+        yield from ijson.items(f, '')
+
+
+try:
+    with open(input_file, 'rb') as f, open(tmp_file, 'w', encoding='utf-8') as out:
+        # Filter entries where BookStatus is "Not Liberated"
+        not_liberated_count = 0
+
+        for book in iter_books(f):
+            if book.get('BookStatus') == 'NotLiberated' and book.get('ContentType') != 'Episode':
+                print(f"{book.get('AuthorNames')} {book.get('Title')}")
+                author = book.get('AuthorNames', 'Unknown Author')
+                title = book.get('Title', 'Unknown Title')
+                # Write to output file as we go
+                out.write(f"{author} - {title}\n")
+                not_liberated_count += 1
+
+    os.replace(tmp_file, output_file)
+    print(f"Found {not_liberated_count} books with 'Not Liberated' status")
     print(f"Results written to {output_file}")
 
 except FileNotFoundError:
     print(f"Error: Could not find file '{input_file}'")
-except json.JSONDecodeError:
+except JSON_ERRORS:
     print(f"Error: Invalid JSON format in '{input_file}'")
 except Exception as e:
     print(f"Error: {e}")
+finally:
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
@@ -7,23 +7,43 @@ import string
 import time
 import sys
 
+# Define the character set to use (lowercase, uppercase, space, and punctuation)
+CHARS = string.ascii_letters + ' ' + ',.!?;:'
+
 def generate_random_string(length):
     """Generate a random string of specified length"""
-    # Define the character set to use (lowercase, uppercase, space, and punctuation)
-    chars = string.ascii_letters + ' ' + ',.!?;:'
-    
-    # Generate the random string
-    return ''.join(random.choice(chars) for _ in range(length))
+    # random.choices picks every character in one call
+    return ''.join(random.choices(CHARS, k=length))
 
-def check_match(random_string, target="Hello World"):
-    """Check if the random string matches the target"""
-    return random_string == target
+def match_per_position(target):
+    """Guess each position independently, keeping characters once they match"""
+    result = [None] * len(target)
+    attempts = 0
+    start_time = time.time()
+    
+    while None in result:
+        for i, target_char in enumerate(target):
+            if result[i] is None:
+                attempts += 1
+                if random.choice(CHARS) == target_char:
+                    result[i] = target_char
+    
+    elapsed_time = time.time() - start_time
+    print(f"\nSUCCESS! Match found after {attempts:,} character guesses!")
+    print(f"Elapsed time: {elapsed_time:.2f} seconds")
+    print(f"Random string: '{''.join(result)}'")
 
 def main():
     # Define the target string
     target = "Hello World"
     target_length = len(target)
     
+    # The per-position mode finishes in ~len(CHARS) * len(target) guesses
+    if '--per-position' in sys.argv[1:]:
+        print(f"Target string: '{target}'")
+        match_per_position(target)
+        return
+    
     # Set up counters
     attempts = 0
     start_time = time.time()
@@ -43,7 +63,7 @@ def main():
         attempts += 1
         
         # Check if the random string matches the target
-        if check_match(random_string, target):
+        if random_string == target:
             elapsed_time = time.time() - start_time
             print(f"\nSUCCESS! Match found after {attempts:,} attempts!")
             print(f"Elapsed time: {elapsed_time:.2f} seconds")
@@ -59,7 +79,7 @@ def main():
     
     # Calculate and print the probability
     # For each position, we have len(chars) possibilities
-    chars_count = len(string.ascii_letters + ' ' + ',.!?;:')
+    chars_count = len(CHARS)
     total_possibilities = chars_count ** target_length
     probability = 1 / total_possibilities
     
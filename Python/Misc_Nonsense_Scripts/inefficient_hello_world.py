@@ -6,6 +6,7 @@ import time
 import sys
 import os
 import random
+import shutil
 import json
 import socket
 import hashlib
@@ -15,7 +16,7 @@ import threading
 import sqlite3
 import logging
 from datetime import datetime
-from functools import reduce
+from functools import reduce, lru_cache
 
 # Set up logging
 logging.basicConfig(
@@ -25,13 +26,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger('IneffcientHelloWorld')
 
+# Set IHW_FAST=1 to skip all of the artificial delays
+_FAST = os.environ.get('IHW_FAST') == '1'
+
+def artificial_delay(seconds):
+    """Sleep for the given time, unless running in fast mode"""
+    if not _FAST:
+        time.sleep(seconds)
+
+# Shared hasher with the namespace prefix already absorbed; copied per character
+_CHAR_HASHER = hashlib.sha256(b"inefficient-hello-world:")
+
 class CharacterGenerator:
     """A class to generate a single character with extreme complexity"""
     
     def __init__(self, target_char, server_mode=False):
         self.target_char = target_char
         self.server_mode = server_mode
-        self.char_hash = hashlib.sha512(target_char.encode()).hexdigest()
+        hasher = _CHAR_HASHER.copy()
+        hasher.update(target_char.encode())
+        self.char_hash = hasher.hexdigest()
         logger.debug(f"Character generator initialized for target '{target_char}' with hash {self.char_hash[:10]}...")
         
         # Create a temporary directory specific to this character
@@ -39,14 +53,15 @@ class CharacterGenerator:
         if not os.path.exists(self.temp_dir):
             os.makedirs(self.temp_dir)
             
-        # Initialize a database for this character
-        self.db_path = f"{self.temp_dir}/char_data.db"
+        # Initialize an in-memory database for this character, kept open until cleanup
+        self.conn = sqlite3.connect(':memory:', isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=MEMORY")
+        self.conn.execute("PRAGMA synchronous=OFF")
         self.initialize_database()
         
     def initialize_database(self):
         """Create an SQLite database just for this character"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         # Create a table to store character data
         cursor.execute('''
@@ -63,7 +78,7 @@ class CharacterGenerator:
         # Insert the character data
         ascii_value = ord(self.target_char)
         binary = bin(ascii_value)[2:].zfill(8)
-        hash_value = hashlib.md5(self.target_char.encode()).hexdigest()
+        hash_value = self.char_hash
         encoded = base64.b64encode(self.target_char.encode()).decode()
         timestamp = datetime.now().isoformat()
         
@@ -72,8 +87,6 @@ class CharacterGenerator:
         VALUES (?, ?, ?, ?, ?)
         ''', (ascii_value, binary, hash_value, encoded, timestamp))
         
-        conn.commit()
-        conn.close()
         logger.info(f"Database initialized for character '{self.target_char}'")
         
     def generate_character_files(self):
@@ -115,6 +128,8 @@ class CharacterGenerator:
         if not self.server_mode:
             return
             
+        server_ready = threading.Event()
+        
         def server_thread():
             try:
                 server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -125,6 +140,7 @@ class CharacterGenerator:
                 # Save the port number to a file
                 with open(f"{self.temp_dir}/server_port.txt", "w") as f:
                     f.write(str(port))
+                server_ready.set()
                 
                 logger.info(f"Character server for '{self.target_char}' listening on port {port}")
                 
@@ -139,6 +155,9 @@ class CharacterGenerator:
                 
             except Exception as e:
                 logger.error(f"Server error: {e}")
+            finally:
+                # Never leave the main thread waiting if the server failed to start
+                server_ready.set()
                 
         thread = threading.Thread(target=server_thread)
         thread.daemon = True
@@ -146,33 +165,30 @@ class CharacterGenerator:
         logger.debug(f"Started server thread for character '{self.target_char}'")
         
         # Wait for the server to start
-        while not os.path.exists(f"{self.temp_dir}/server_port.txt"):
-            time.sleep(0.01)
+        server_ready.wait()
         
         # Add artificial delay
-        time.sleep(random.uniform(0.05, 0.2))
+        artificial_delay(random.uniform(0.05, 0.2))
         
     def retrieve_character(self):
         """Retrieve the character in the most complex way possible"""
         # First get from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT ascii_value FROM character_data LIMIT 1")
+        cursor = self.conn.execute("SELECT ascii_value FROM character_data LIMIT 1")
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             ascii_value = result[0]
             # Add a delay proportional to the ASCII value
             delay = ascii_value / 1000
-            time.sleep(delay)
+            artificial_delay(delay)
             
             # Read the character from files too
             with open(f"{self.temp_dir}/character.txt", "r") as f:
-                lines = f.readlines()
+                f.readline()  # Skip the "Character:" line
+                ascii_line = f.readline()
                 
             # Parse the ASCII value from the file
-            file_ascii = int(lines[1].split(":")[1].strip())
+            file_ascii = int(ascii_line.partition(":")[2])
             
             # Verify that they match
             if file_ascii == ascii_value:
@@ -211,20 +227,14 @@ class CharacterGenerator:
     def cleanup(self):
         """Clean up resources"""
         # Add some artificial delay before cleanup
-        time.sleep(random.uniform(0.1, 0.3))
+        artificial_delay(random.uniform(0.1, 0.3))
         
         try:
             # Close database connection
-            conn = sqlite3.connect(self.db_path)
-            conn.close()
+            self.conn.close()
             
             # Remove files and directory
-            for filename in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, filename)
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-                    
-            os.rmdir(self.temp_dir)
+            shutil.rmtree(self.temp_dir)
             logger.debug(f"Cleaned up resources for character '{self.target_char}'")
             
         except Exception as e:
@@ -241,7 +251,7 @@ class CharacterGenerator:
         self.start_character_server()
         
         # Add random delay
-        time.sleep(random.uniform(0.1, 0.5))
+        artificial_delay(random.uniform(0.1, 0.5))
         
         # Retrieve the character
         result = self.retrieve_character()
@@ -252,6 +262,12 @@ class CharacterGenerator:
         return result
 
 
+@lru_cache(maxsize=128)
+def process_character_cached(char, server_mode):
+    """Run the character pipeline once per (character, mode); repeats come from the cache"""
+    return CharacterGenerator(char, server_mode=server_mode).process()
+
+
 class StringComposer:
     """A class to compose strings character by character"""
     
@@ -267,22 +283,18 @@ class StringComposer:
             
         logger.info(f"String composer initialized for: '{target_string}'")
         
-    def process_character(self, char, index):
-        """Process a single character"""
+    def process_character(self, char, index, out):
+        """Process a single character, writing the result to the open file out"""
         logger.debug(f"Processing character at index {index}: '{char}'")
         
-        # Create a generator for this character
-        generator = CharacterGenerator(char, server_mode=self.use_server and index % 2 == 0)
-        
-        # Process the character
-        result = generator.process()
+        # Process the character (repeated characters reuse the first result)
+        result = process_character_cached(char, self.use_server and index % 2 == 0)
         
         # Add to results
         if result:
             self.results.append(result)
             # Also write to file
-            with open(self.temp_file, "a") as f:
-                f.write(result)
+            out.write(result)
         else:
             logger.error(f"Failed to process character '{char}' at index {index}")
             
@@ -290,15 +302,13 @@ class StringComposer:
         """Process the entire string"""
         logger.info(f"Starting to process string: '{self.target_string}'")
         
-        # Clear the output file
-        with open(self.temp_file, "w") as f:
-            f.write("")
-            
-        # Process each character
-        for i, char in enumerate(self.target_string):
-            self.process_character(char, i)
-            # Add a delay between characters
-            time.sleep(random.uniform(0.2, 0.7))
+        # Open (and clear) the output file once for the whole string
+        with open(self.temp_file, "w", buffering=1 << 16) as out:
+            # Process each character
+            for i, char in enumerate(self.target_string):
+                self.process_character(char, i, out)
+                # Add a delay between characters
+                artificial_delay(random.uniform(0.2, 0.7))
             
         # Read the result from file
         with open(self.temp_file, "r") as f:
@@ -335,32 +345,17 @@ class DataValidator:
     
     def __init__(self, expected_output):
         self.expected_output = expected_output
-        self.hash = hashlib.sha256(expected_output.encode()).hexdigest()
         
     def validate(self, actual_output):
         """Validate the output in a complex way"""
         logger.info("Validating output...")
         
         # Add delay proportional to string length
-        time.sleep(len(actual_output) * 0.1)
-        
-        # Check character by character
-        for i, (expected, actual) in enumerate(zip(self.expected_output, actual_output)):
-            if expected != actual:
-                logger.error(f"Validation failed at position {i}: expected '{expected}', got '{actual}'")
-                return False
-                
-        # Check lengths
-        if len(self.expected_output) != len(actual_output):
-            logger.error(f"Length mismatch: expected {len(self.expected_output)}, got {len(actual_output)}")
-            return False
-            
-        # Compute hash of actual output
-        actual_hash = hashlib.sha256(actual_output.encode()).hexdigest()
+        artificial_delay(len(actual_output) * 0.1)
         
-        # Verify hash
-        if self.hash != actual_hash:
-            logger.error(f"Hash mismatch: expected {self.hash}, got {actual_hash}")
+        # A single string comparison covers every character and the length
+        if self.expected_output != actual_output:
+            logger.error(f"Validation failed: expected '{self.expected_output}', got '{actual_output}'")
             return False
             
         logger.info("Output validation successful")
@@ -399,14 +394,22 @@ def inefficient_hello_world():
         
     # Clean up any remaining temp directories
     if os.path.exists("temp_hello_world"):
-        import shutil
         shutil.rmtree("temp_hello_world")
 
 
+def hello_world():
+    """Print 'Hello, World!' directly; the target is a constant, so there is nothing to compute"""
+    print("Hello, World!")
+
+
 if __name__ == "__main__":
+    # Skip the whole pipeline when asked for the answer directly
+    if '--direct' in sys.argv[1:]:
+        hello_world()
+        sys.exit(0)
+    
     # Set up the environment
     if os.path.exists("temp_hello_world"):
-        import shutil
         shutil.rmtree("temp_hello_world")
         
     # Start the program
@@ -1,24 +1,42 @@
 import requests
 import os
+import threading
 import spotipy
+from concurrent.futures import ThreadPoolExecutor
 from auth import *
 from spotipy.oauth2 import SpotifyOAuth
 
-sp = spotipy.Spotify(auth_manager=SpotifyOAuth(client_id=SPOTIPY_CLIENT_ID,
-                                               client_secret=SPOTIPY_CLIENT_SECRET,
-                                               redirect_uri=SPOTIPY_REDIRECT_URI,
-                                               scope="user-library-read",
-                                               cache_path="token.txt"))
+auth_manager = SpotifyOAuth(client_id=SPOTIPY_CLIENT_ID,
+                            client_secret=SPOTIPY_CLIENT_SECRET,
+                            redirect_uri=SPOTIPY_REDIRECT_URI,
+                            scope="user-library-read",
+                            cache_path="token.txt")
+sp = spotipy.Spotify(auth_manager=auth_manager)
+
+# Number of playlists fetched at once
+MAX_WORKERS = 8
+
+# Each worker thread gets its own client (and HTTP session) sharing one auth manager
+thread_clients = threading.local()
+
+def get_thread_client():
+    if not hasattr(thread_clients, 'sp'):
+        thread_clients.sp = spotipy.Spotify(auth_manager=auth_manager)
+    return thread_clients.sp
 
 def get_all_playlists():
-    playlists = []
     limit = 50
     offset = 0
-    playlists = sp.current_user_playlists(limit, offset)
+    results = sp.current_user_playlists(limit, offset)
+    playlists = results['items']
+    while results['next']:
+        results = sp.next(results)
+        playlists.extend(results['items'])
     return playlists
 
 ## https://stackoverflow.com/questions/39086287/spotipy-how-to-read-more-than-100-tracks-from-a-playlist
 def get_playlist_tracks(username,playlist_id):
+    sp = get_thread_client()
     results = sp.user_playlist_tracks(username,playlist_id)
     tracks = results['items']
     while results['next']:
@@ -36,20 +54,22 @@ def save_playlists_to_files(this_list, listname):
     with open(filename, 'w', encoding='utf-8') as f:
          f.write(f"Playlist: {listname}\n")
          f.write("Tracks:\n")
-            # Optionally, you can fetch and list track names here
-         for eachtrack in this_list:
-             f.write(f"{eachtrack}\n")
+         if this_list:
+             f.write("\n".join(this_list) + "\n")
+
+def fetch_playlist(playlist):
+   return get_playlist_tracks(playlist['owner']['id'], playlist['id'])
 
 # Example usage (replace 'your_access_token_here' with your actual token)
 playlists = get_all_playlists()
 #print(playlists)
-for each in playlists['items']:
+# Track fetches are network bound, so run them concurrently
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+   all_tracks = list(executor.map(fetch_playlist, playlists))
+
+for each, mytracks in zip(playlists, all_tracks):
    this_list=[]
    #print(each['name'])
-   listid = each['id']
-   ownerid = each['owner']['id']
-   #print("\n")
-   mytracks = get_playlist_tracks(ownerid,listid)
    for eachtrack in mytracks:
       trackentry = f"{eachtrack['track']['artists'][0]['name']} - {eachtrack['track']['album']['name']} - {eachtrack['track']['name']}"
       this_list.append(trackentry)
@@ -1,9 +1,12 @@
 import os
+import json
 import argparse
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
+SEARCH_CACHE_FILE = "search_cache.json"
+BATCH_SIZE = 50  # Maximum requests per batch HTTP call
 
 
 def authenticate_youtube():
@@ -79,9 +82,9 @@ def get_existing_videos_in_playlist(youtube, playlist_id):
         while request:
             response = request.execute()
             
-            for item in response.get("items", []):
-                video_id = item["contentDetails"]["videoId"]
-                video_ids.add(video_id)
+            video_ids.update(
+                item["contentDetails"]["videoId"] for item in response.get("items", [])
+            )
             
             request = youtube.playlistItems().list_next(request, response)
         
@@ -91,6 +94,51 @@ def get_existing_videos_in_playlist(youtube, playlist_id):
         return set()
 
 
+def get_playlist_size(youtube, playlist_id):
+    """Return the number of videos in the playlist."""
+    response = youtube.playlists().list(
+        part="contentDetails",
+        id=playlist_id
+    ).execute()
+    
+    items = response.get("items", [])
+    return items[0]["contentDetails"]["itemCount"] if items else 0
+
+
+def is_video_in_playlist(youtube, playlist_id, video_id):
+    """Check a single video's membership without listing the whole playlist."""
+    response = youtube.playlistItems().list(
+        part="id",
+        playlistId=playlist_id,
+        videoId=video_id,
+        maxResults=1
+    ).execute()
+    
+    return bool(response.get("items"))
+
+
+def find_existing_videos(youtube, playlist_id, video_ids):
+    """Return which of video_ids are already in the playlist.
+    
+    Uses one lookup per video when that takes fewer API calls than
+    listing the whole playlist 50 items at a time.
+    """
+    try:
+        playlist_size = get_playlist_size(youtube, playlist_id)
+        full_scan_calls = -(-playlist_size // 50)
+        
+        if len(video_ids) >= full_scan_calls:
+            return get_existing_videos_in_playlist(youtube, playlist_id) & set(video_ids)
+        
+        return {
+            video_id for video_id in video_ids
+            if is_video_in_playlist(youtube, playlist_id, video_id)
+        }
+    except Exception as e:
+        print(f"Error getting existing videos: {e}")
+        return set()
+
+
 def get_or_create_playlist(youtube, playlist_name):
     """Get existing playlist by name, or create a new one if it doesn't exist."""
     playlist_id = find_playlist_by_name(youtube, playlist_name)
@@ -102,6 +150,24 @@ def get_or_create_playlist(youtube, playlist_name):
         return create_playlist(youtube, playlist_name)
 
 
+def load_search_cache():
+    """Load previously resolved search queries, keyed by query text."""
+    try:
+        with open(SEARCH_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        print(f"Ignoring invalid search cache: {SEARCH_CACHE_FILE}")
+        return {}
+
+
+def save_search_cache(search_cache):
+    """Save resolved search queries so later runs skip the search API."""
+    with open(SEARCH_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(search_cache, f, indent=2)
+
+
 def search_video(youtube, query):
     """Search for a video and return the video ID of the first result."""
     search_response = youtube.search().list(
@@ -115,9 +181,9 @@ def search_video(youtube, query):
     return items[0]["id"]["videoId"] if items else None
 
 
-def add_video_to_playlist(youtube, playlist_id, video_id):
-    """Add a video to the specified playlist."""
-    youtube.playlistItems().insert(
+def build_insert_request(youtube, playlist_id, video_id):
+    """Build (without executing) a request adding a video to the playlist."""
+    return youtube.playlistItems().insert(
         part="snippet",
         body={
             "snippet": {
@@ -128,7 +194,55 @@ def add_video_to_playlist(youtube, playlist_id, video_id):
                 }
             }
         }
-    ).execute()
+    )
+
+
+def add_videos_to_playlist(youtube, playlist_id, pending):
+    """Add videos using batched requests. Returns (added, failed) counts.
+    
+    pending maps each video ID to the search query that found it.
+    The batch endpoint may run the inserts in any order, and concurrent
+    appends to one playlist can fail with a conflict, so anything that
+    fails in a batch is retried one at a time in input order.
+    """
+    added_count = 0
+    failed_count = 0
+    retry = set()
+    
+    def handle_response(request_id, response, exception):
+        nonlocal added_count
+        if exception is not None:
+            retry.add(request_id)
+        else:
+            print(f"  ✓ Added '{pending[request_id]}' to playlist")
+            added_count += 1
+    
+    video_ids = list(pending)
+    for start in range(0, len(video_ids), BATCH_SIZE):
+        batch = youtube.new_batch_http_request(callback=handle_response)
+        chunk = video_ids[start:start + BATCH_SIZE]
+        for video_id in chunk:
+            batch.add(build_insert_request(youtube, playlist_id, video_id), request_id=video_id)
+        
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"  ❌ Error sending batch: {e}")
+            retry.update(chunk)
+    
+    for video_id in video_ids:
+        if video_id not in retry:
+            continue
+        query = pending[video_id]
+        try:
+            build_insert_request(youtube, playlist_id, video_id).execute()
+            print(f"  ✓ Added '{query}' to playlist")
+            added_count += 1
+        except Exception as e:
+            print(f"  ❌ Error adding '{query}' to playlist: {e}")
+            failed_count += 1
+    
+    return added_count, failed_count
 
 
 def create_playlist_and_add_songs(file_path):
@@ -142,49 +256,83 @@ def create_playlist_and_add_songs(file_path):
     # Get or create playlist
     playlist_id = get_or_create_playlist(youtube, playlist_name)
     
-    # Get existing videos to avoid duplicates
-    print("Checking for existing videos in playlist...")
-    existing_videos = get_existing_videos_in_playlist(youtube, playlist_id)
-    print(f"Found {len(existing_videos)} existing videos\n")
+    # Reuse search results from earlier runs (each search costs 100 quota units)
+    search_cache = load_search_cache()
+    seen_queries = set()
     
     # Process each line from the file
     added_count = 0
     skipped_count = 0
     failed_count = 0
+    resolved = []  # (query, video ID) for every search that found a video
     
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            query = line.strip()
-            
-            # Skip empty lines
-            if not query:
-                continue
-            
-            print(f"Searching for: {query}")
-            
-            # Search for video
-            video_id = search_video(youtube, query)
-            
-            if not video_id:
-                print(f"  ❌ No results found")
-                failed_count += 1
-                continue
-            
-            # Check if video already exists in playlist
-            if video_id in existing_videos:
-                print(f"  ⏭️  Already in playlist, skipping")
-                skipped_count += 1
-                continue
-            
-            # Add to playlist
-            try:
-                add_video_to_playlist(youtube, playlist_id, video_id)
-                print(f"  ✓ Added to playlist")
-                added_count += 1
-                existing_videos.add(video_id)  # Update our cache
-            except Exception as e:
-                print(f"  ❌ Error adding to playlist: {e}")
-                failed_count += 1
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                query = line.strip()
+                
+                # Skip empty lines
+                if not query:
+                    continue
+                
+                # Skip repeated lines within the same file
+                if query in seen_queries:
+                    continue
+                seen_queries.add(query)
+                
+                print(f"Searching for: {query}")
+                
+                # Search for video, using the cached result when available
+                if query in search_cache:
+                    video_id = search_cache[query]
+                else:
+                    try:
+                        video_id = search_video(youtube, query)
+                    except Exception as e:
+                        # Usually quotaExceeded, so later searches would fail too;
+                        # stop here and still add the videos found so far
+                        print(f"  ❌ Search failed, stopping searches: {e}")
+                        failed_count += 1
+                        break
+                    if video_id:
+                        search_cache[query] = video_id
+                
+                if not video_id:
+                    print(f"  ❌ No results found")
+                    failed_count += 1
+                    continue
+                
+                resolved.append((query, video_id))
+    
+    finally:
+        # Keep paid-for searches even if the run is interrupted
+        save_search_cache(search_cache)
+    
+    # Get existing videos to avoid duplicates, checking only the videos we found
+    print("\nChecking for existing videos in playlist...")
+    existing_videos = find_existing_videos(
+        youtube, playlist_id, list({video_id for _, video_id in resolved})
+    )
+    print(f"Found {len(existing_videos)} matching videos already in playlist")
+    
+    pending = {}  # video ID -> query, inserted in batches below
+    for query, video_id in resolved:
+        # Check if video already exists in playlist
+        if video_id in existing_videos:
+            print(f"  ⏭️  '{query}' already in playlist, skipping")
+            skipped_count += 1
+            continue
+        
+        # Queue for adding to playlist
+        pending[video_id] = query
+        existing_videos.add(video_id)  # Update our cache
+    
+    # Add queued videos, up to BATCH_SIZE per HTTP round-trip
+    if pending:
+        print(f"\nAdding {len(pending)} videos to playlist...")
+        batch_added, batch_failed = add_videos_to_playlist(youtube, playlist_id, pending)
+        added_count += batch_added
+        failed_count += batch_failed
     
     print(f"\n{'='*50}")
     print(f"Done! Playlist ID: {playlist_id}")
@@ -9,90 +9,131 @@ It extracts blog entries and converts HTML content to markdown format.
 
 import xml.etree.ElementTree as ET
 import re
-import html
+from html.parser import HTMLParser
 import os
 from datetime import datetime
 from urllib.parse import urlparse
 import argparse
 
 
+# Patterns used by clean_filename, compiled once for all entries
+_FILENAME_STRIP_RE = re.compile(r'<[^>]+>|[^\w\s-]')
+_FILENAME_DASH_RE = re.compile(r'[-\s]+')
+
+# Collapses runs of blank lines in html_to_markdown output
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+# Markdown emitted for tags that map directly to a fixed marker
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+INLINE_MARKERS = {'strong': '**', 'b': '**', 'em': '*', 'i': '*'}
+
+
 def clean_filename(title):
     """Convert title to a safe filename."""
-    # Remove HTML tags if any
-    title = re.sub(r'<[^>]+>', '', title)
-    # Replace spaces and special characters
-    title = re.sub(r'[^\w\s-]', '', title)
-    title = re.sub(r'[-\s]+', '-', title)
+    # Remove HTML tags and special characters in a single pass
+    title = _FILENAME_STRIP_RE.sub('', title)
+    # Replace runs of spaces and dashes
+    title = _FILENAME_DASH_RE.sub('-', title)
     return title.strip('-').lower()
 
 
+class MarkdownHTMLParser(HTMLParser):
+    """Walk Blogger post HTML once and emit the equivalent markdown."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.output = []
+        self.links = []        # (href, output index) for open <a> tags
+        self.lists = []        # [list type, item counter] for open <ul>/<ol>
+        self.quotes = []       # output index for open <blockquote> tags
+        self.in_pre = 0
+
+    def handle_starttag(self, tag, attrs):
+        # Attributes arrive already parsed, so only links and images look at them
+        if tag in INLINE_MARKERS:
+            self.output.append(INLINE_MARKERS[tag])
+        elif tag in HEADING_TAGS:
+            self.output.append('\n' + '#' * HEADING_TAGS[tag] + ' ')
+        elif tag == 'br':
+            self.output.append('\n')
+        elif tag == 'a':
+            self.links.append((dict(attrs).get('href'), len(self.output)))
+        elif tag == 'img':
+            self.handle_startendtag(tag, attrs)
+        elif tag in ('ul', 'ol'):
+            self.lists.append([tag, 0])
+            self.output.append('\n')
+        elif tag == 'li' and self.lists:
+            current = self.lists[-1]
+            current[1] += 1
+            indent = '  ' * (len(self.lists) - 1)
+            marker = '-' if current[0] == 'ul' else f'{current[1]}.'
+            self.output.append(f'\n{indent}{marker} ')
+        elif tag == 'blockquote':
+            self.quotes.append(len(self.output))
+        elif tag == 'pre':
+            self.in_pre += 1
+            self.output.append('\n```\n')
+        elif tag == 'code' and not self.in_pre:
+            self.output.append('`')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == 'img':
+            attrs = dict(attrs)
+            src = attrs.get('src')
+            if src:
+                self.output.append(f'![{attrs.get("alt") or ""}]({src})')
+        else:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in INLINE_MARKERS:
+            self.output.append(INLINE_MARKERS[tag])
+        elif tag in HEADING_TAGS or tag == 'p':
+            self.output.append('\n\n')
+        elif tag == 'a' and self.links:
+            href, start = self.links.pop()
+            if href:
+                text = ''.join(self.output[start:])
+                del self.output[start:]
+                self.output.append(f'[{text}]({href})')
+        elif tag in ('ul', 'ol') and self.lists:
+            self.lists.pop()
+            self.output.append('\n')
+        elif tag == 'blockquote' and self.quotes:
+            start = self.quotes.pop()
+            text = ''.join(self.output[start:]).strip()
+            del self.output[start:]
+            self.output.append('\n> ' + text.replace('\n', '\n> ') + '\n\n')
+        elif tag == 'pre' and self.in_pre:
+            self.in_pre -= 1
+            self.output.append('\n```\n')
+        elif tag == 'code' and not self.in_pre:
+            self.output.append('`')
+
+    def handle_data(self, data):
+        self.output.append(data.replace('\xa0', ' '))
+
+    def get_markdown(self):
+        return ''.join(self.output)
+
+
 def html_to_markdown(html_content):
     """Convert HTML content to markdown format."""
     if not html_content:
         return ""
     
-    # Decode HTML entities
-    content = html.unescape(html_content)
-    
-    # Convert images to markdown format
-    img_pattern = r'<img[^>]+src="([^"]+)"[^>]*(?:alt="([^"]*)")?[^>]*>'
-    content = re.sub(img_pattern, lambda m: f'![{m.group(2) or ""}]({m.group(1)})', content)
-    
-    # Convert links to markdown format
-    link_pattern = r'<a[^>]+href="([^"]+)"[^>]*>(.*?)</a>'
-    content = re.sub(link_pattern, r'[\2](\1)', content, flags=re.DOTALL)
-    
-    # Convert headings
-    content = re.sub(r'<h([1-6])[^>]*>(.*?)</h[1-6]>', lambda m: '#' * int(m.group(1)) + ' ' + m.group(2), content, flags=re.DOTALL)
-    
-    # Convert paragraphs
-    content = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', content, flags=re.DOTALL)
-    
-    # Convert line breaks
-    content = re.sub(r'<br\s*/?>', '\n', content)
-    
-    # Convert bold and italic
-    content = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', content, flags=re.DOTALL)
-    content = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', content, flags=re.DOTALL)
-    content = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', content, flags=re.DOTALL)
-    content = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', content, flags=re.DOTALL)
-    
-    # Convert lists
-    content = re.sub(r'<ul[^>]*>(.*?)</ul>', lambda m: convert_list(m.group(1), 'ul'), content, flags=re.DOTALL)
-    content = re.sub(r'<ol[^>]*>(.*?)</ol>', lambda m: convert_list(m.group(1), 'ol'), content, flags=re.DOTALL)
-    
-    # Convert blockquotes
-    content = re.sub(r'<blockquote[^>]*>(.*?)</blockquote>', lambda m: '> ' + m.group(1).strip().replace('\n', '\n> '), content, flags=re.DOTALL)
-    
-    # Convert code blocks
-    content = re.sub(r'<pre[^>]*><code[^>]*>(.*?)</code></pre>', r'```\n\1\n```', content, flags=re.DOTALL)
-    content = re.sub(r'<code[^>]*>(.*?)</code>', r'`\1`', content, flags=re.DOTALL)
-    
-    # Remove remaining HTML tags
-    content = re.sub(r'<[^>]+>', '', content)
+    parser = MarkdownHTMLParser()
+    parser.feed(html_content)
+    parser.close()
+    content = parser.get_markdown()
     
     # Clean up extra whitespace
-    content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-    content = re.sub(r'&nbsp;', ' ', content)
+    content = _BLANK_LINES_RE.sub('\n\n', content)
     
     return content.strip()
 
 
-def convert_list(list_content, list_type):
-    """Convert HTML list to markdown format."""
-    items = re.findall(r'<li[^>]*>(.*?)</li>', list_content, flags=re.DOTALL)
-    markdown_items = []
-    
-    for i, item in enumerate(items):
-        item = re.sub(r'<[^>]+>', '', item).strip()
-        if list_type == 'ul':
-            markdown_items.append(f'- {item}')
-        else:  # ol
-            markdown_items.append(f'{i+1}. {item}')
-    
-    return '\n' + '\n'.join(markdown_items) + '\n'
-
-
 def format_date(date_string):
     """Format the published date."""
     try:
@@ -103,79 +144,105 @@ def format_date(date_string):
         return date_string
 
 
+# Namespace prefixes used in Blogger exports, pre-resolved for tag matching
+ATOM = '{http://www.w3.org/2005/Atom}'
+APP = '{http://purl.org/atom/app#}'
+ATOM_ENTRY = f'{ATOM}entry'
+ATOM_CATEGORY = f'{ATOM}category'
+ATOM_TITLE = f'{ATOM}title[@type="text"]'
+ATOM_PUBLISHED = f'{ATOM}published'
+ATOM_CONTENT = f'{ATOM}content[@type="html"]'
+APP_CONTROL = f'{APP}control'
+APP_DRAFT = f'{APP}draft'
+KIND_SCHEME = 'http://schemas.google.com/g/2005#kind'
+
+
+def iter_entries(xml_file):
+    """Yield entry elements as they are parsed, freeing each one afterwards."""
+    context = ET.iterparse(xml_file, events=('start', 'end'))
+    _, root = next(context)
+    
+    for event, elem in context:
+        if event == 'end' and elem.tag == ATOM_ENTRY:
+            yield elem
+            # Drop finished entries so memory stays at one entry at a time
+            root.clear()
+
+
+def convert_entry(entry, output_dir):
+    """Write a single blog entry as a markdown file and return its filename."""
+    # Skip settings entries before doing any other lookups
+    for child in entry:
+        if child.tag == ATOM_CATEGORY and child.get('scheme') == KIND_SCHEME:
+            if 'settings' in child.get('term', ''):
+                return None
+            break
+    
+    # Check if it's a draft (but don't skip - just note it)
+    is_draft = False
+    control = entry.find(APP_CONTROL)
+    if control is not None:
+        draft = control.find(APP_DRAFT)
+        if draft is not None and draft.text == 'yes':
+            is_draft = True
+    
+    # Extract title
+    title_elem = entry.find(ATOM_TITLE)
+    title = title_elem.text if title_elem is not None else 'Untitled'
+    
+    # Extract published date
+    published_elem = entry.find(ATOM_PUBLISHED)
+    if published_elem is None:
+        return None
+    
+    published_date = format_date(published_elem.text)
+    
+    # Extract content
+    content_elem = entry.find(ATOM_CONTENT)
+    if content_elem is None:
+        return None
+    
+    html_content = content_elem.text or ''
+    markdown_content = html_to_markdown(html_content)
+    
+    # Create filename
+    safe_title = clean_filename(title)
+    draft_prefix = "draft-" if is_draft else ""
+    filename = f"{draft_prefix}{published_date}-{safe_title}.md"
+    filepath = os.path.join(output_dir, filename)
+    
+    # Write markdown file
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(f"# {title}\n\n")
+        f.write(f"**Date:** {published_date}\n")
+        if is_draft:
+            f.write(f"**Status:** Draft\n")
+        f.write(f"\n{markdown_content}\n")
+    
+    return filename
+
+
 def extract_blog_entries(xml_file, output_dir='blog_posts'):
     """Extract blog entries from Blogger XML and convert to markdown files."""
     
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Parse the XML file
+    entries_processed = 0
+    
+    # Stream entries from the XML file instead of loading the whole tree
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+        for entry in iter_entries(xml_file):
+            filename = convert_entry(entry, output_dir)
+            if filename is None:
+                continue
+            
+            print(f"Created: {filename}")
+            entries_processed += 1
     except ET.ParseError as e:
         print(f"Error parsing XML file: {e}")
         return
     
-    # Define namespaces
-    namespaces = {
-        'atom': 'http://www.w3.org/2005/Atom',
-        'app': 'http://purl.org/atom/app#'
-    }
-    
-    entries_processed = 0
-    
-    # Find all entry elements
-    for entry in root.findall('.//atom:entry', namespaces):
-        # Skip settings entries
-        category = entry.find('atom:category[@scheme="http://schemas.google.com/g/2005#kind"]', namespaces)
-        if category is not None and 'settings' in category.get('term', ''):
-            continue
-        
-        # Check if it's a draft (but don't skip - just note it)
-        is_draft = False
-        control = entry.find('app:control', namespaces)
-        if control is not None:
-            draft = control.find('app:draft', namespaces)
-            if draft is not None and draft.text == 'yes':
-                is_draft = True
-        
-        # Extract title
-        title_elem = entry.find('atom:title[@type="text"]', namespaces)
-        title = title_elem.text if title_elem is not None else 'Untitled'
-        
-        # Extract published date
-        published_elem = entry.find('atom:published', namespaces)
-        if published_elem is None:
-            continue
-        
-        published_date = format_date(published_elem.text)
-        
-        # Extract content
-        content_elem = entry.find('atom:content[@type="html"]', namespaces)
-        if content_elem is None:
-            continue
-        
-        html_content = content_elem.text or ''
-        markdown_content = html_to_markdown(html_content)
-        
-        # Create filename
-        safe_title = clean_filename(title)
-        draft_prefix = "draft-" if is_draft else ""
-        filename = f"{draft_prefix}{published_date}-{safe_title}.md"
-        filepath = os.path.join(output_dir, filename)
-        
-        # Write markdown file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"# {title}\n\n")
-            f.write(f"**Date:** {published_date}\n")
-            if is_draft:
-                f.write(f"**Status:** Draft\n")
-            f.write(f"\n{markdown_content}\n")
-        
-        print(f"Created: {filename}")
-        entries_processed += 1
-    
     print(f"\nProcessed {entries_processed} blog entries.")
 
 
@@ -13,25 +13,38 @@ import sys
 import re
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 from pathlib import Path
 
 
+_URL_RE = re.compile(r'https?://boards\.4chan\.org/([^/]+)/thread/(\d+)')
+
+# Characters that are invalid in filenames on common filesystems
+_BAD_FS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Number of images downloaded at once
+MAX_WORKERS = 8
+
+# Per-thread record of downloaded image IDs, kept in the output directory
+CACHE_FILENAME = '.downloaded.json'
+
+
 def extract_board_and_thread(url):
     """Extract board name and thread number from 4chan URL"""
-    pattern = r'https?://boards\.4chan\.org/([^/]+)/thread/(\d+)'
-    match = re.match(pattern, url)
+    match = _URL_RE.match(url)
     if not match:
         raise ValueError("Invalid 4chan thread URL format")
     return match.group(1), match.group(2)
 
 
-def get_thread_data(board, thread_no):
+def get_thread_data(board, thread_no, session):
     """Fetch thread data from 4chan API"""
     api_url = f"https://a.4cdn.org/{board}/thread/{thread_no}.json"
     
     try:
-        response = requests.get(api_url, timeout=30)
+        response = session.get(api_url, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -45,19 +58,65 @@ def create_directory(thread_no):
     return dir_path
 
 
-def download_image(url, filepath):
+def load_download_cache(output_dir):
+    """Load the set of image IDs already downloaded for this thread"""
+    cache_path = output_dir / CACHE_FILENAME
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return set(json.load(f))
+    except FileNotFoundError:
+        return set()
+    except (json.JSONDecodeError, TypeError):
+        print(f"Ignoring invalid download cache: {cache_path}")
+        return set()
+
+
+def save_download_cache(output_dir, done):
+    """Save downloaded image IDs, replacing the old cache atomically"""
+    cache_path = output_dir / CACHE_FILENAME
+    tmp_path = cache_path.with_name(CACHE_FILENAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(sorted(done), f)
+    tmp_path.replace(cache_path)
+
+
+def create_session():
+    """Create a shared session so all requests reuse pooled connections"""
+    session = requests.Session()
+    # One connection per worker thread, kept alive for the whole run
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS)
+    session.mount('https://', adapter)
+    return session
+
+
+def is_downloaded(filepath, expected_size):
+    """Check whether a complete copy of the image is already on disk"""
+    try:
+        size = filepath.stat().st_size
+    except FileNotFoundError:
+        return False
+    # The thread API reports each file's size, so partial files get re-fetched
+    return expected_size is None or size == expected_size
+
+
+def download_image(url, filepath, session):
     """Download a single image"""
+    # Write to a temporary file so an interrupted download never looks complete
+    part_path = filepath.with_name(filepath.name + '.part')
     try:
-        response = requests.get(url, stream=True, timeout=30)
+        response = session.get(url, stream=True, timeout=30)
         response.raise_for_status()
         
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+        # Write the body in 1 MB chunks instead of looping over 8 KB ones
+        with open(part_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
                 f.write(chunk)
         
+        part_path.replace(filepath)
         return True
     except requests.exceptions.RequestException as e:
         print(f"Failed to download {url}: {e}")
+        part_path.unlink(missing_ok=True)
         return False
 
 
@@ -69,6 +128,7 @@ def main():
     
     thread_url = sys.argv[1]
     
+    session = create_session()
     try:
         # Extract board and thread number from URL
         board, thread_no = extract_board_and_thread(thread_url)
@@ -76,7 +136,7 @@ def main():
         
         # Get thread data from API
         print("Fetching thread data...")
-        thread_data = get_thread_data(board, thread_no)
+        thread_data = get_thread_data(board, thread_no, session)
         
         # Create output directory
         output_dir = create_directory(thread_no)
@@ -86,6 +146,10 @@ def main():
         posts = thread_data.get('posts', [])
         image_count = 0
         downloaded_count = 0
+        tasks = []
+        
+        # Image IDs fetched on earlier runs can be skipped without touching disk
+        done = load_download_cache(output_dir)
         
         for post in posts:
             # Check if post has an image
@@ -93,6 +157,11 @@ def main():
                 # Construct image URL
                 tim = post['tim']  # Renamed filename (timestamp)
                 ext = post['ext']  # File extension
+                
+                if tim in done:
+                    downloaded_count += 1
+                    continue
+                
                 filename = post.get('filename', str(tim))  # Original filename
                 
                 # Full-sized image URL
@@ -101,22 +170,36 @@ def main():
                 # Create safe filename
                 safe_filename = f"{filename}_{tim}{ext}"
                 # Remove invalid characters for filesystem
-                safe_filename = re.sub(r'[<>:"/\\|?*]', '_', safe_filename)
+                safe_filename = safe_filename.translate(_BAD_FS)
                 
                 filepath = output_dir / safe_filename
                 
-                # Skip if file already exists
-                if filepath.exists():
+                # Skip if the file was already downloaded in full
+                if is_downloaded(filepath, post.get('fsize')):
                     print(f"Skipping {safe_filename} (already exists)")
                     downloaded_count += 1
+                    done.add(tim)
                     continue
                 
-                print(f"Downloading: {safe_filename}")
-                if download_image(image_url, filepath):
-                    downloaded_count += 1
-                
+                tasks.append((tim, image_url, filepath))
                 image_count += 1
         
+        # Download the remaining images in parallel over the pooled session
+        print(f"Downloading {len(tasks)} images...")
+        def fetch(task):
+            tim, image_url, filepath = task
+            print(f"Downloading: {filepath.name}")
+            if not download_image(image_url, filepath, session):
+                return False
+            done.add(tim)
+            return True
+        
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                downloaded_count += sum(executor.map(fetch, tasks))
+        finally:
+            save_download_cache(output_dir, done)
+        
         print(f"\nDownload complete!")
         print(f"Total images found: {image_count}")
         print(f"Successfully downloaded: {downloaded_count}")
@@ -128,6 +211,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        session.close()
 
 
 if __name__ == "__main__":
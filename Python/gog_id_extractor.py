@@ -6,9 +6,94 @@ Output: Creates gog_ids.txt with one ID per line
 """
 
 import json
+import os
+import re
 import sys
 import ast
 
+# ijson (with its C yajl2 backend when installed) streams IDs without loading the whole file
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson parses in C several times faster than json; its errors subclass json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Python-only literals and their JSON equivalents
+# Only literals in value positions, so 'True North' inside a string is left alone
+_PY_LITERALS_RE = re.compile(r'([:\[,]\s*)(True|False|None)(?=\s*[,\]}])')
+_PY_TO_JSON = {'True': 'true', 'False': 'false', 'None': 'null'}
+_QUOTES_TO_JSON = str.maketrans({"'": '"'})
+
+FORMAT_ERROR = "Error: Input data format not recognized. Expected list of dicts or single dict with '_id_mirror' key."
+
+
+def python_literal_to_json(content):
+    """
+    Rewrite a Python dict/list repr as JSON using cheap string replacements
+    
+    Returns None when the repr can't be rewritten safely.
+    """
+    if '"' in content:
+        # Double quotes only appear in a repr around strings containing an
+        # apostrophe, which a blind quote swap would break; leave it to ast
+        return None
+    content = content.translate(_QUOTES_TO_JSON)
+    return _PY_LITERALS_RE.sub(lambda m: m.group(1) + _PY_TO_JSON[m.group(2)], content)
+
+def parse_python_literal(content):
+    """Parse a Python dict/list repr, trying the fast JSON rewrite before ast"""
+    rewritten = python_literal_to_json(content)
+    if rewritten is not None:
+        try:
+            return json_loads(rewritten)
+        except json.JSONDecodeError:
+            pass
+    # Fall back to evaluating as a Python literal (much slower, but
+    # handles strings containing quotes that the rewrite can't)
+    return ast.literal_eval(content)
+
+def stream_gog_ids(input_filename):
+    """
+    Stream _id_mirror values from a JSON file straight into gog_ids.txt
+    
+    Returns the number of IDs written, or None if the data format is not
+    recognized. Raises ijson.JSONError if the file is not valid JSON.
+    """
+    # Write to a temp file so a parse failure never leaves a partial gog_ids.txt
+    tmp_filename = 'gog_ids.txt.tmp'
+    with open(input_filename, 'rb') as file:
+        # Peek at the first non-whitespace byte to see if the data is a list
+        first = file.read(1)
+        while first.isspace():
+            first = file.read(1)
+        file.seek(0)
+        
+        is_list = first == b'['
+        prefix = 'item._id_mirror' if is_list else '_id_mirror'
+        
+        id_count = 0
+        with open(tmp_filename, 'w', encoding='utf-8') as output_file:
+            try:
+                # Floats rather than Decimal, so IDs print the same as the json path
+                for id_mirror in ijson.items(file, prefix, use_float=True):
+                    output_file.write(f"{id_mirror}\n")
+                    id_count += 1
+            except BaseException:
+                output_file.close()
+                os.remove(tmp_filename)
+                raise
+    
+    if not is_list and id_count == 0:
+        os.remove(tmp_filename)
+        return None
+    os.replace(tmp_filename, 'gog_ids.txt')
+    return id_count
+
 def extract_gog_ids(input_filename):
     """
     Extract _id_mirror values from the input file and save to gog_ids.txt
@@ -17,40 +102,56 @@ def extract_gog_ids(input_filename):
         input_filename (str): Path to the input JSON-style file
     """
     try:
+        streamed_invalid_json = False
+        if ijson is not None:
+            try:
+                id_count = stream_gog_ids(input_filename)
+            except ijson.JSONError:
+                # Not plain JSON (e.g. Python literal format), parse it in memory below
+                streamed_invalid_json = True
+            else:
+                if id_count is None:
+                    print(FORMAT_ERROR)
+                    return False
+                print(f"Successfully extracted {id_count} IDs to gog_ids.txt")
+                return True
+        
         with open(input_filename, 'r', encoding='utf-8') as file:
             content = file.read().strip()
         
-        # Try to parse as JSON first
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            # If JSON parsing fails, try to evaluate as Python literal
-            # This handles cases where the file might be Python dict/list format
-            try:
-                data = ast.literal_eval(content)
-            except (ValueError, SyntaxError) as e:
-                print(f"Error: Could not parse the file as JSON or Python literal: {e}")
-                return False
+            if streamed_invalid_json:
+                # ijson already showed this isn't JSON, skip straight to the rewrite
+                data = parse_python_literal(content)
+            else:
+                # Try to parse as JSON first
+                try:
+                    data = json_loads(content)
+                except json.JSONDecodeError:
+                    # If JSON parsing fails, the file is likely in Python dict/list format
+                    data = parse_python_literal(content)
+        except (ValueError, SyntaxError) as e:
+            print(f"Error: Could not parse the file as JSON or Python literal: {e}")
+            return False
         
         # Extract _id_mirror values
-        id_mirrors = []
-        
         if isinstance(data, list):
             # Data is a list of dictionaries
-            for item in data:
-                if isinstance(item, dict) and '_id_mirror' in item:
-                    id_mirrors.append(str(item['_id_mirror']))
+            id_mirrors = [
+                str(item['_id_mirror']) for item in data
+                if isinstance(item, dict) and '_id_mirror' in item
+            ]
         elif isinstance(data, dict) and '_id_mirror' in data:
             # Data is a single dictionary
-            id_mirrors.append(str(data['_id_mirror']))
+            id_mirrors = [str(data['_id_mirror'])]
         else:
-            print("Error: Input data format not recognized. Expected list of dicts or single dict with '_id_mirror' key.")
+            print(FORMAT_ERROR)
             return False
         
         # Write to output file
         with open('gog_ids.txt', 'w', encoding='utf-8') as output_file:
-            for id_mirror in id_mirrors:
-                output_file.write(f"{id_mirror}\n")
+            if id_mirrors:
+                output_file.write('\n'.join(id_mirrors) + '\n')
         
         print(f"Successfully extracted {len(id_mirrors)} IDs to gog_ids.txt")
         return True
@@ -26,7 +26,15 @@ def combine_markdown_files(folder_path, output_file="combined.md", sort_files=Tr
         return
     
     # Find all markdown files (both .md and .markdown extensions)
-    md_files = list(folder.glob("*.md")) + list(folder.glob("*.markdown"))
+    # in a single directory sweep
+    md_files = [
+        Path(entry.path) for entry in os.scandir(folder)
+        if entry.is_file() and entry.name.lower().endswith(('.md', '.markdown'))
+    ]
+    
+    # Never read the output file back in while it's being written
+    output_path = folder / output_file
+    md_files = [md_file for md_file in md_files if md_file != output_path]
     
     if not md_files:
         print(f"No markdown files found in '{folder_path}'.")
@@ -40,29 +48,27 @@ def combine_markdown_files(folder_path, output_file="combined.md", sort_files=Tr
     for file in md_files:
         print(f"  - {file.name}")
     
-    # Combine files
-    combined_content = []
-    
-    for md_file in md_files:
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                
-            # Add a header with the filename
-            combined_content.append(f"# {md_file.stem}\n")
-            combined_content.append(f"*Source: {md_file.name}*\n")
-            combined_content.append(content)
-            combined_content.append("\n---\n")  # Add separator between files
-            
-        except Exception as e:
-            print(f"Error reading {md_file.name}: {e}")
-            continue
-    
-    # Write combined content to output file
-    output_path = folder / output_file
+    # Combine files, streaming each one straight into the output file
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(combined_content))
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+            first_file = True
+            
+            for md_file in md_files:
+                try:
+                    with open(md_file, 'r', encoding='utf-8') as f:
+                        content = f.read().strip()
+                except Exception as e:
+                    print(f"Error reading {md_file.name}: {e}")
+                    continue
+                
+                if not first_file:
+                    out.write("\n")
+                first_file = False
+                
+                # Add a header with the filename
+                out.write(f"# {md_file.stem}\n\n*Source: {md_file.name}*\n\n")
+                out.write(content)
+                out.write("\n\n---\n")  # Add separator between files
         
         print(f"\nSuccessfully combined {len(md_files)} files into '{output_path}'")
         
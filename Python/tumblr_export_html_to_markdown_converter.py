@@ -7,81 +7,72 @@ Converts HTML files to Markdown format with custom image paths and date-based fi
 
 import os
 import re
+import multiprocessing
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from bs4 import BeautifulSoup
 import html2text
 
+# Matches both markdown images ![alt](path) and links [text](path)
+_IMG_RE = re.compile(r'(!?)\[([^\]]*)\]\(([^)]+)\)')
+_IMG_EXT_RE = re.compile(r'\.(?:jpe?g|png|gif|bmp|webp|svg)$', re.IGNORECASE)
+
+# Pattern to match dates like "January 15th, 2025 7:37am"
+_DATE_RE = re.compile(r'(\w+)\s+(\d+)(?:st|nd|rd|th),?\s+(\d{4})\s+(\d+):(\d+)(?:am|pm)', re.IGNORECASE)
+# Characters at the end of each post searched for the timestamp before the full file
+DATE_SEARCH_WINDOW = 4096
+# Month numbers keyed by the first three letters of the month name
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
 def extract_date_from_html(html_content):
     """
     Extract date from HTML content in format 'January 15th, 2025 7:37am'
     Returns formatted date as YYYY.MM.DD or None if not found
     """
-    # Pattern to match dates like "January 15th, 2025 7:37am"
-    date_pattern = r'(\w+)\s+(\d+)(?:st|nd|rd|th),?\s+(\d{4})\s+(\d+):(\d+)(?:am|pm)'
-    
-    match = re.search(date_pattern, html_content, re.IGNORECASE)
-    if match:
-        month_name, day, year, hour, minute = match.groups()
-        
-        # Convert month name to number
-        month_names = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12
-        }
-        
-        month_num = month_names.get(month_name.lower())
-        if month_num:
-            return f"{year}.{month_num:02d}.{int(day):02d}"
+    # The timestamp sits in the post footer, so check the end of the file
+    # before falling back to scanning the whole post body
+    tail_start = max(0, len(html_content) - DATE_SEARCH_WINDOW)
+    for start in (tail_start, 0):
+        match = _DATE_RE.search(html_content, start)
+        if match:
+            month_name, day, year, hour, minute = match.groups()
+            
+            # Convert month name to number
+            month_num = _MONTHS.get(month_name[:3].lower())
+            if month_num:
+                return f"{year}.{month_num:02d}.{int(day):02d}"
     
     return None
 
 def convert_image_paths(markdown_content):
     """
     Convert image paths to point to tumblrmedia/[ImageFileName]
-    Handles both markdown image syntax and HTML img tags
+    Handles both markdown image syntax and links to image files
     """
-    # Pattern to match markdown image syntax: ![alt](path)
-    def replace_markdown_image_path(match):
-        alt_text = match.group(1)
-        original_path = match.group(2)
+    def replace_image_path(match):
+        bang, text, original_path = match.groups()
         
-        # Extract just the filename from the path
-        filename = os.path.basename(original_path)
-        new_path = f"tumblrmedia/{filename}"
+        # Keep regular links that don't point at an image file
+        if not bang and not _IMG_EXT_RE.search(original_path):
+            return match.group(0)
         
-        return f"![{alt_text}]({new_path})"
+        # Extract just the filename from the path and embed it as an image
+        filename = os.path.basename(original_path)
+        return f"![{text}](tumblrmedia/{filename})"
     
-    # Pattern to match markdown link syntax that should be images: [text](image_path)
-    def replace_image_links(match):
-        link_text = match.group(1)
-        original_path = match.group(2)
-        
-        # Check if this looks like an image file
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'}
-        if any(original_path.lower().endswith(ext) for ext in image_extensions):
-            filename = os.path.basename(original_path)
-            new_path = f"tumblrmedia/{filename}"
-            # Convert link to embedded image
-            return f"![{link_text}]({new_path})"
-        else:
-            # Keep as regular link
-            return f"[{link_text}]({original_path})"
-    
-    # Replace existing markdown image paths
-    markdown_content = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', replace_markdown_image_path, markdown_content)
-    
-    # Convert image links to embedded images
-    markdown_content = re.sub(r'\[([^\]]*)\]\(([^)]+)\)', replace_image_links, markdown_content)
-    
-    return markdown_content
+    # Images and image links are rewritten in a single pass
+    return _IMG_RE.sub(replace_image_path, markdown_content)
 
 def html_to_markdown(html_content):
     """
     Convert HTML content to Markdown using html2text
     """
-    # Configure html2text
+    # Configure html2text. A fresh instance is used for every file on purpose:
+    # parser state from unclosed tags (e.g. <blockquote>, <pre>) carries over
+    # into the next handle() call, and construction is ~0.1% of conversion time.
     h = html2text.HTML2Text()
     h.ignore_links = False
     h.ignore_images = False
@@ -95,6 +86,41 @@ def html_to_markdown(html_content):
     
     return markdown
 
+def convert_html_file(html_file, output_path):
+    """
+    Convert a single HTML file to Markdown and return a status message
+    """
+    try:
+        # Read HTML content
+        with open(html_file, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        
+        # Extract date from HTML
+        date_str = extract_date_from_html(html_content)
+        
+        if not date_str:
+            return f"Warning: Could not extract date from {html_file.name}, skipping..."
+        
+        # Convert HTML to Markdown
+        markdown_content = html_to_markdown(html_content)
+        
+        # Convert image paths
+        markdown_content = convert_image_paths(markdown_content)
+        
+        # Create output filename
+        base_name = html_file.stem  # filename without extension
+        output_filename = f"{date_str} - {base_name}.md"
+        output_file_path = output_path / output_filename
+        
+        # Write markdown file
+        with open(output_file_path, 'w', encoding='utf-8') as f:
+            f.write(markdown_content)
+        
+        return f"Converted: {html_file.name} -> {output_filename}"
+        
+    except Exception as e:
+        return f"Error processing {html_file.name}: {str(e)}"
+
 def process_html_folder(input_folder, output_folder=None):
     """
     Process all HTML files in the input folder and convert to Markdown
@@ -121,38 +147,11 @@ def process_html_folder(input_folder, output_folder=None):
     
     print(f"Found {len(html_files)} HTML files to process...")
     
-    for html_file in html_files:
-        try:
-            # Read HTML content
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Extract date from HTML
-            date_str = extract_date_from_html(html_content)
-            
-            if not date_str:
-                print(f"Warning: Could not extract date from {html_file.name}, skipping...")
-                continue
-            
-            # Convert HTML to Markdown
-            markdown_content = html_to_markdown(html_content)
-            
-            # Convert image paths
-            markdown_content = convert_image_paths(markdown_content)
-            
-            # Create output filename
-            base_name = html_file.stem  # filename without extension
-            output_filename = f"{date_str} - {base_name}.md"
-            output_file_path = output_path / output_filename
-            
-            # Write markdown file
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            print(f"Converted: {html_file.name} -> {output_filename}")
-            
-        except Exception as e:
-            print(f"Error processing {html_file.name}: {str(e)}")
+    # Each file is independent and conversion is CPU bound, so use every core
+    convert = partial(convert_html_file, output_path=output_path)
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        for message in pool.imap_unordered(convert, html_files, chunksize=8):
+            print(message)
     
     print("Conversion complete!")
 
@@ -175,13 +174,6 @@ def main():
         print("Error: html2text library is required. Install it with: pip install html2text")
         return
     
-    # Check if BeautifulSoup is available
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError:
-        print("Error: beautifulsoup4 library is required. Install it with: pip install beautifulsoup4")
-        return
-    
     process_html_folder(args.input_folder, args.output)
 
 if __name__ == "__main__":